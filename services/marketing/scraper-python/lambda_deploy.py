@@ -6,17 +6,283 @@ Playwright를 Lambda에서 실행하기 위한 설정 포함
 
 import os
 import sys
+import platform
+import hashlib
+import mmap
+import stat
+import tarfile
+import time
 import zipfile
 import shutil
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+# zlib-ng(SIMD 가속)이 있으면 사용, 없으면 표준 zlib으로 폴백 - 동일한 DEFLATE 스트림 생성
+try:
+    from zlib_ng import zlib_ng as _zlib
+except ImportError:
+    import zlib as _zlib
+
+# Layer는 대부분 바이너리라 압축 레벨을 올려도 크기 이득이 거의 없음
+LAYER_COMPRESSLEVEL = 1
+# 함수 패키지는 작고 텍스트 위주라 기본 레벨 유지
+FUNCTION_COMPRESSLEVEL = 6
+
+# 이미 압축된 포맷은 DEFLATE 없이 그대로 저장
+STORED_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.woff', '.woff2',
+    '.pak', '.br', '.gz', '.xz', '.bz2', '.zip', '.whl', '.jar'
+})
+
+# 압축 후 크기가 원본의 95% 이상이면 압축 이득이 없다고 판단
+MIN_COMPRESS_RATIO = 0.95
+
+LAMBDA_PLATFORM = 'manylinux2014_x86_64'
+LAMBDA_PYTHON_VERSION = '3.11'
+
+# Lambda 런타임(CPython 3.11, x86_64)용 휠만 받도록 고정 - 호스트 인터프리터와 무관
+PIP_TARGET_FLAGS = (
+    '--platform', LAMBDA_PLATFORM,
+    '--python-version', LAMBDA_PYTHON_VERSION,
+    '--implementation', 'cp',
+    '--only-binary', ':all:',
+    '--no-compile'
+)
+PLAYWRIGHT_REQUIREMENT = 'playwright==1.41.0'
+
+# pip 설치 결과 캐시 위치 (요구사항 해시별 디렉토리)
+CACHE_ROOT = Path.home() / '.cache' / 'lambda_deploy'
+
+# S3에 올릴 Chromium 아카이브 (Lambda에서 /tmp로 한 번만 압축 해제)
+CHROMIUM_ARCHIVE_NAME = 'chromium.tar.br'
+CHROMIUM_BROTLI_QUALITY = 9
+
+# 런타임에 필요 없는 디렉토리/파일 (패키지 크기 절감)
+PRUNE_DIR_NAMES = frozenset({'__pycache__', 'tests'})
+PRUNE_FILE_SUFFIXES = frozenset({'.pyc', '.pyi'})
+
+
+def _encode_entry(data, suffix: str, compresslevel: int):
+    """DEFLATE 또는 STORED 중 더 적합한 방식으로 인코딩"""
+    if suffix not in STORED_EXTENSIONS:
+        compressor = _zlib.compressobj(compresslevel, _zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+        if len(payload) < len(data) * MIN_COMPRESS_RATIO:
+            return zipfile.ZIP_DEFLATED, payload
+    return zipfile.ZIP_STORED, bytes(data)
+
+
+def _compress_entry(task):
+    """파일 하나를 압축하거나 그대로 저장할 엔트리로 준비 (워커 프로세스에서 실행)"""
+    file_path, arc_name, compresslevel = task
+    zinfo = zipfile.ZipInfo.from_file(file_path, arc_name)
+    suffix = Path(file_path).suffix.lower()
+    
+    if zinfo.file_size == 0:
+        zinfo.compress_type, payload = zipfile.ZIP_STORED, b''
+        zinfo.CRC = 0
+    else:
+        # mmap으로 읽어 파일 내용을 힙에 한 번 더 복사하지 않음
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            zinfo.compress_type, payload = _encode_entry(data, suffix, compresslevel)
+            zinfo.CRC = _zlib.crc32(data)
+    
+    zinfo.compress_size = len(payload)
+    return zinfo, payload
+
+
+def _write_precompressed(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, payload: bytes):
+    """이미 압축된 데이터를 재압축 없이 ZIP 엔트리로 추가"""
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zinfo.header_offset = zf.fp.tell()
+    zf.fp.write(zinfo.FileHeader())
+    zf.fp.write(payload)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    zf.start_dir = zf.fp.tell()
+
+
+def _write_symlink(zf: zipfile.ZipFile, link_path: str, arc_name: str):
+    """심볼릭 링크를 대상 파일 내용이 아닌 링크 엔트리로 추가"""
+    st = os.lstat(link_path)
+    zinfo = zipfile.ZipInfo(arc_name, time.localtime(st.st_mtime)[:6])
+    zinfo.create_system = 3  # Unix
+    zinfo.external_attr = (stat.S_IFLNK | 0o777) << 16
+    zf.writestr(zinfo, os.readlink(link_path))
+
+
+def _zip_directory(src_dir: Path, zip_path: Path, compresslevel: int,
+                   remove_sources: bool = False):
+    """
+    디렉토리 전체를 ZIP으로 압축 (파일 단위 병렬 압축)
+    
+    remove_sources가 True면 ZIP에 기록된 원본 파일을 즉시 삭제해
+    빌드 트리와 ZIP이 디스크에 동시에 온전히 존재하지 않도록 함
+    """
+    tasks = []
+    links = []
+    for root, dirs, files in os.walk(src_dir):
+        # os.walk는 디렉토리 심볼릭 링크를 따라가지 않으므로 여기서 함께 수집
+        for name in dirs + files:
+            file_path = Path(root) / name
+            arc_name = str(file_path.relative_to(src_dir))
+            if file_path.is_symlink():
+                links.append((str(file_path), arc_name))
+            elif name in files:
+                tasks.append((str(file_path), arc_name, compresslevel))
+    
+    # 압축은 워커 프로세스에서, ZIP 기록은 메인 프로세스에서 순서대로 수행
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool, \
+            zipfile.ZipFile(zip_path, 'w', allowZip64=True) as zf:
+        results = pool.map(_compress_entry, tasks, chunksize=16)
+        for (file_path, _, _), (zinfo, payload) in zip(tasks, results):
+            _write_precompressed(zf, zinfo, payload)
+            if remove_sources:
+                os.unlink(file_path)
+        
+        for link_path, arc_name in links:
+            _write_symlink(zf, link_path, arc_name)
+            if remove_sources:
+                os.unlink(link_path)
+
+
+def _pip_install(args: list, target: Path, cache_key: str) -> subprocess.CompletedProcess:
+    """
+    Lambda 플랫폼(manylinux) 휠을 대상 디렉토리에 설치
+    
+    설치 결과는 cache_key(요구사항 내용)와 pip 대상 플래그의 해시별로 캐시되어
+    동일한 조건으로 다시 빌드할 때 pip 실행을 건너뜀
+    """
+    key_source = '\n'.join([*PIP_TARGET_FLAGS, cache_key])
+    key = hashlib.sha256(key_source.encode()).hexdigest()[:16]
+    cache_dir = CACHE_ROOT / key
+    
+    if cache_dir.exists():
+        shutil.copytree(cache_dir, target, symlinks=True, dirs_exist_ok=True)
+        return subprocess.CompletedProcess(args, 0, f'Restored from cache: {cache_dir}\n', '')
+    
+    env = {**os.environ, 'PIP_DISABLE_PIP_VERSION_CHECK': '1'}
+    
+    # .pyc는 Lambda에서 다시 생성되므로 설치 시 컴파일 생략 (--no-compile)
+    result = subprocess.run([
+        sys.executable, '-m', 'pip', 'install',
+        *args,
+        '-t', str(target),
+        *PIP_TARGET_FLAGS
+    ], env=env, capture_output=True, text=True)
+    
+    if result.returncode == 0:
+        # 중간에 중단되어도 불완전한 캐시가 남지 않도록 임시 경로에 복사 후 교체
+        partial_dir = cache_dir.with_name(key + '.partial')
+        if partial_dir.exists():
+            shutil.rmtree(partial_dir)
+        shutil.copytree(target, partial_dir, symlinks=True)
+        partial_dir.rename(cache_dir)
+    
+    return result
+
+
+def _is_shared_library(name: str) -> bool:
+    """libfoo.so, libfoo.so.1.2 형태의 공유 라이브러리 여부"""
+    return name.endswith('.so') or '.so.' in name
+
+
+def _slim_directory(target: Path):
+    """불필요한 파일 삭제 및 공유 라이브러리 디버그 심볼 제거"""
+    strip = shutil.which('strip')
+    
+    for root, dirs, files in os.walk(target):
+        for name in [d for d in dirs if d in PRUNE_DIR_NAMES]:
+            dirs.remove(name)
+            dir_path = Path(root) / name
+            if not dir_path.is_symlink():
+                shutil.rmtree(dir_path)
+        
+        for name in files:
+            file_path = Path(root) / name
+            if file_path.suffix in PRUNE_FILE_SUFFIXES or \
+                    (name == 'RECORD' and root.endswith('.dist-info')):
+                file_path.unlink()
+            elif strip and _is_shared_library(name) and not file_path.is_symlink():
+                subprocess.run([strip, '--strip-unneeded', str(file_path)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+class _BrotliWriter:
+    """쓰기 데이터를 brotli로 압축해 파일에 기록 (tarfile 스트림 모드용)"""
+    
+    def __init__(self, fp, quality: int):
+        import brotli
+        self._fp = fp
+        self._compressor = brotli.Compressor(quality=quality)
+    
+    def write(self, data: bytes) -> int:
+        self._fp.write(self._compressor.process(data))
+        return len(data)
+    
+    def close(self):
+        self._fp.write(self._compressor.finish())
+
+
+def _check_chromium_build_host():
+    """
+    Chromium 아카이브를 만들 수 있는 호스트인지 확인
+    
+    playwright install은 호스트 플랫폼용 브라우저를 받으므로
+    Lambda와 같은 linux x86_64에서만 올바른 바이너리를 얻을 수 있음
+    """
+    machine = platform.machine()
+    if sys.platform != 'linux' or machine not in ('x86_64', 'AMD64'):
+        raise RuntimeError(
+            "Chromium 아카이브는 linux x86_64 호스트에서만 생성할 수 있습니다 "
+            f"(현재: {sys.platform}/{machine}). "
+            "Docker 등 linux/amd64 환경에서 다시 실행하세요."
+        )
+
+
+def _package_chromium(work_dir: Path, archive_path: Path, playwright_dir: Path):
+    """
+    Layer에 설치된 Playwright 버전의 Chromium을 내려받아 tar.br 아카이브로 패키징
+    
+    호스트에 설치된 playwright가 아닌 playwright_dir의 패키지로 설치해
+    Layer의 Playwright와 Chromium 리비전이 항상 일치하도록 함
+    """
+    browsers_dir = work_dir / 'chromium_build'
+    if browsers_dir.exists():
+        shutil.rmtree(browsers_dir)
+    
+    env = {
+        **os.environ,
+        'PLAYWRIGHT_BROWSERS_PATH': str(browsers_dir),
+        'PYTHONPATH': str(playwright_dir)
+    }
+    subprocess.run([sys.executable, '-m', 'playwright', 'install', 'chromium'],
+                   env=env, check=True)
+    
+    chrome_dirs = list(browsers_dir.glob('chromium-*/chrome-linux'))
+    if not chrome_dirs:
+        raise RuntimeError(f"Chromium 설치 결과를 찾을 수 없습니다: {browsers_dir}")
+    
+    with open(archive_path, 'wb') as fp:
+        writer = _BrotliWriter(fp, CHROMIUM_BROTLI_QUALITY)
+        with tarfile.open(fileobj=writer, mode='w|') as tar:
+            tar.add(chrome_dirs[0], arcname='.')
+        writer.close()
+    
+    shutil.rmtree(browsers_dir)
+
 
 def create_lambda_deployment():
     """Lambda 배포 패키지 생성"""
     
     print("=== AWS Lambda Deployment Package Builder ===\n")
     
+    # 빌드 결과물을 만들기 전에 Chromium 패키징 가능 여부부터 확인
+    _check_chromium_build_host()
+    
     # 디렉토리 설정
     current_dir = Path.cwd()
     build_dir = current_dir / 'lambda_build'
@@ -33,82 +299,67 @@ def create_lambda_deployment():
     
     print("1. Preparing directories...")
     
-    # Lambda 함수 코드 복사
-    shutil.copy('smartplace_scraper.py', build_dir / 'lambda_function.py')
-    
     # requirements.txt 수정 (Lambda용)
     lambda_requirements = """beautifulsoup4==4.12.3
-requests==2.31.0
-boto3==1.34.14
+soupsieve==2.5
 lxml==5.0.0
-html5lib==1.1"""
+boto3==1.34.14
+Brotli==1.1.0
+orjson==3.9.10"""
     
     with open(build_dir / 'requirements.txt', 'w') as f:
         f.write(lambda_requirements)
     
+    layer_python_dir = layer_dir / 'python'
+    layer_python_dir.mkdir()
+    
     print("2. Installing dependencies...")
     
-    # 의존성 설치 (Lambda 환경)
-    subprocess.run([
-        sys.executable, '-m', 'pip', 'install',
-        '-r', str(build_dir / 'requirements.txt'),
-        '-t', str(build_dir),
-        '--platform', 'manylinux2014_x86_64',
-        '--only-binary', ':all:'
-    ], check=True)
+    # 함수 의존성과 Playwright Layer는 서로 다른 디렉토리에 설치되므로 동시에 진행
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        installs = [
+            pool.submit(_pip_install, ['-r', str(build_dir / 'requirements.txt')],
+                        build_dir, lambda_requirements),
+            pool.submit(_pip_install, [PLAYWRIGHT_REQUIREMENT],
+                        layer_python_dir, PLAYWRIGHT_REQUIREMENT)
+        ]
+        results = [future.result() for future in installs]
+    
+    for result in results:
+        if result.returncode != 0:
+            print(result.stdout)
+            print(result.stderr, file=sys.stderr)
+        result.check_returncode()
+    
+    # 디버그 심볼 및 런타임 불필요 파일 제거
+    _slim_directory(build_dir)
+    _slim_directory(layer_python_dir)
+    
+    # Lambda 함수 코드 복사 (캐시 복원 시 덮어쓰이지 않도록 설치 이후에 복사)
+    shutil.copy('smartplace_scraper.py', build_dir / 'lambda_function.py')
     
     print("3. Creating Lambda function ZIP...")
     
     # Lambda 함수 ZIP 생성
     function_zip = current_dir / 'lambda_function.zip'
-    with zipfile.ZipFile(function_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(build_dir):
-            for file in files:
-                file_path = Path(root) / file
-                arc_name = file_path.relative_to(build_dir)
-                zf.write(file_path, arc_name)
+    _zip_directory(build_dir, function_zip, FUNCTION_COMPRESSLEVEL, remove_sources=True)
     
     print(f"   Created: {function_zip}")
     
-    # Playwright Layer 생성 (별도)
-    print("\n4. Creating Playwright Lambda Layer...")
+    # Chromium 아카이브 생성 (S3 업로드용) - Layer ZIP 생성 시 설치 트리가 삭제되므로 먼저 수행
+    print("\n4. Packaging Chromium for S3...")
     
-    layer_python_dir = layer_dir / 'python'
-    layer_python_dir.mkdir()
+    chromium_archive = current_dir / CHROMIUM_ARCHIVE_NAME
+    _package_chromium(current_dir, chromium_archive, layer_python_dir)
     
-    # Playwright 설치
-    subprocess.run([
-        sys.executable, '-m', 'pip', 'install',
-        'playwright==1.41.0',
-        '-t', str(layer_python_dir),
-        '--platform', 'manylinux2014_x86_64',
-        '--only-binary', ':all:'
-    ], check=True)
-    
-    # Chromium 바이너리 다운로드 스크립트
-    download_script = layer_python_dir / 'download_chromium.py'
-    download_script.write_text("""
-import os
-from playwright.sync_api import sync_playwright
-
-def download():
-    with sync_playwright() as p:
-        # Chromium 다운로드
-        p.chromium.launch()
-        print("Chromium downloaded successfully")
-
-if __name__ == '__main__':
-    download()
-""")
+    print(f"   Created: {chromium_archive}")
+    
+    # Playwright Layer 생성 (별도)
+    print("\n5. Creating Playwright Lambda Layer...")
     
-    # Layer ZIP 생성
+    # Layer ZIP 생성 (Chromium은 포함하지 않음)
     layer_zip = current_dir / 'playwright_layer.zip'
-    with zipfile.ZipFile(layer_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(layer_dir):
-            for file in files:
-                file_path = Path(root) / file
-                arc_name = file_path.relative_to(layer_dir)
-                zf.write(file_path, arc_name)
+    _zip_directory(layer_dir, layer_zip, LAYER_COMPRESSLEVEL, remove_sources=True)
     
     print(f"   Created: {layer_zip}")
     
@@ -120,15 +371,20 @@ if __name__ == '__main__':
     print("\nNext steps:")
     print("1. Upload 'playwright_layer.zip' as a Lambda Layer")
     print("2. Upload 'lambda_function.zip' as your Lambda function")
-    print("3. Configure Lambda with:")
+    print(f"3. Upload '{CHROMIUM_ARCHIVE_NAME}' to an S3 bucket readable by the function")
+    print("4. Configure Lambda with:")
     print("   - Runtime: Python 3.11")
     print("   - Handler: lambda_function.lambda_handler")
     print("   - Timeout: 60 seconds")
     print("   - Memory: 1024 MB")
     print("   - Environment variables:")
-    print("     - PLAYWRIGHT_BROWSERS_PATH=/opt/python")
+    print("     - CHROMIUM_S3_BUCKET=<bucket>")
+    print(f"     - CHROMIUM_S3_KEY={CHROMIUM_ARCHIVE_NAME}")
+    print("\nNote: chrome-linux links against system libraries (libnss3, libatk, libgbm, ...)")
+    print("      that the python3.11 runtime does not provide. Ship them in a separate layer")
+    print("      under lib/ (/opt/lib is on LD_LIBRARY_PATH) or Chromium will not launch.")
     
-    return function_zip, layer_zip
+    return function_zip, layer_zip, chromium_archive
 
 
 if __name__ == '__main__':
@@ -4,15 +4,176 @@
 AWS Lambda 배포를 위한 Python 구현
 """
 
+import os
 import json
 import asyncio
 import re
+import shutil
+import tarfile
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
 
-from playwright.async_api import async_playwright, Page, Browser
+import orjson
+from playwright.async_api import (
+    async_playwright, Page, Browser, BrowserContext, Route,
+    TimeoutError as PlaywrightTimeoutError
+)
 from bs4 import BeautifulSoup
+import soupsieve as sv
+
+
+# 자주 쓰이는 정규식은 모듈 로드 시 한 번만 컴파일
+_PLACE_ID_RE = re.compile(r'(\d{8,})')
+_DIGIT_RE = re.compile(r'(\d+)')
+
+# Lambda에서 Chromium을 풀어둘 위치 (웜 인보케이션 간 재사용)
+_CHROMIUM_DIR = '/tmp/chromium'
+_CHROMIUM_EXECUTABLE = os.path.join(_CHROMIUM_DIR, 'chrome')
+
+# Lambda 환경을 위한 Chromium 실행 옵션
+_BROWSER_ARGS = (
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--single-process',
+    '--disable-gpu',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process'
+)
+
+# 메모리가 충분하면 단일 프로세스 옵션을 빼고 렌더러를 별도 프로세스로 실행
+_SINGLE_PROCESS_ARGS = frozenset({'--no-zygote', '--single-process'})
+_MULTI_PROCESS_MIN_MEMORY_MB = 1536
+
+# 브라우저 컨텍스트 설정
+_CONTEXT_OPTIONS = {
+    'viewport': {'width': 1280, 'height': 720},
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'locale': 'ko-KR'
+}
+
+# 쿠키/캐시 누적을 막기 위해 컨텍스트를 재생성하는 주기 (스크래핑 횟수)
+_CONTEXT_RECYCLE_INTERVAL = 50
+
+# 차단할 리소스 타입 - 이미지 URL은 DOM 속성에서 읽으므로 실제 다운로드는 불필요
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+# 본문이 렌더링되었는지 판단하는 셀렉터
+_CONTENT_READY_SELECTOR = 'h1, h2, span.GHAhO'
+_CONTENT_READY_TIMEOUT = 5000
+
+# 기본 정보 필드별 CSS 셀렉터 (우선순위 순)
+_FIELD_SELECTORS = {
+    'name': ['span.GHAhO', 'span.Fc1rA', 'h2.place_title'],
+    'category': ['span.lnJFt', 'span.DJJvD'],
+    'address': ['span.IH7VW', 'span.LDgIH'],
+    'phone': ['span.xlx7Q']
+}
+
+# 메뉴/리뷰 목록 셀렉터
+_MENU_SELECTORS = {
+    'item': 'li.E2jtL',
+    'name': 'span.lPzHi',
+    'price': 'div._3qFuX'
+}
+_REVIEW_SELECTORS = {
+    'item': 'li.pui__X35jYm',
+    'rating': 'span.pui__bMWJiy',
+    'text': 'a.pui__xtsQN-',
+    'date': 'time span'
+}
+_MAX_MENU_ITEMS = 20
+_MAX_REVIEWS = 10
+_MAX_IMAGES = 10
+
+# Lambda 한 번의 호출에서 처리할 최대 URL 수 (타임아웃 60초 기준)
+_MAX_BATCH_URLS = 10
+
+# 페이지 내 DOM 추출에 전달할 셀렉터 묶음
+_DOM_SELECTORS = {
+    'fields': _FIELD_SELECTORS,
+    'menu': _MENU_SELECTORS,
+    'review': _REVIEW_SELECTORS,
+    'maxMenuItems': _MAX_MENU_ITEMS,
+    'maxReviews': _MAX_REVIEWS,
+    'maxImages': _MAX_IMAGES
+}
+
+# 셀렉터는 모듈 로드 시 한 번만 컴파일
+_COMPILED_FIELD_SELECTORS = {
+    key: [sv.compile(selector) for selector in selectors]
+    for key, selectors in _FIELD_SELECTORS.items()
+}
+
+
+def _browser_args() -> List[str]:
+    """Lambda 메모리 크기에 맞는 Chromium 실행 옵션"""
+    memory_mb = int(os.environ.get('AWS_LAMBDA_FUNCTION_MEMORY_SIZE', '0'))
+    if memory_mb >= _MULTI_PROCESS_MIN_MEMORY_MB:
+        return [arg for arg in _BROWSER_ARGS if arg not in _SINGLE_PROCESS_ARGS]
+    return list(_BROWSER_ARGS)
+
+
+class _BrotliReader:
+    """brotli 스트림을 읽으면서 압축 해제하는 파일 객체 (tarfile 스트림 모드용)"""
+    
+    def __init__(self, raw, chunk_size: int = 1 << 20):
+        import brotli
+        self._raw = raw
+        self._chunk_size = chunk_size
+        self._decompressor = brotli.Decompressor()
+        self._buffer = bytearray()
+    
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = self._raw.read(self._chunk_size)
+            if not chunk:
+                break
+            self._buffer += self._decompressor.process(chunk)
+        
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+def _ensure_chromium() -> Optional[str]:
+    """
+    S3의 Chromium 아카이브를 /tmp에 한 번만 풀고 실행 파일 경로 반환
+    
+    CHROMIUM_S3_BUCKET이 없으면(로컬 실행) None을 반환해 Playwright 기본 브라우저 사용
+    """
+    bucket = os.environ.get('CHROMIUM_S3_BUCKET')
+    if not bucket:
+        return None
+    
+    if not os.path.exists(_CHROMIUM_DIR):
+        import boto3
+        
+        key = os.environ.get('CHROMIUM_S3_KEY', 'chromium.tar.br')
+        body = boto3.client('s3').get_object(Bucket=bucket, Key=key)['Body']
+        
+        # 압축 해제가 끝난 뒤에 이름을 바꿔 불완전한 디렉토리를 재사용하지 않도록 함
+        partial_dir = _CHROMIUM_DIR + '.partial'
+        shutil.rmtree(partial_dir, ignore_errors=True)
+        with tarfile.open(fileobj=_BrotliReader(body), mode='r|') as tar:
+            tar.extractall(partial_dir)
+        os.rename(partial_dir, _CHROMIUM_DIR)
+    
+    return _CHROMIUM_EXECUTABLE
+
+
+async def _block_heavy_resources(route: Route):
+    """스크래핑에 필요 없는 리소스 요청 차단"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 class SmartPlaceScraper:
@@ -22,7 +183,10 @@ class SmartPlaceScraper:
         self.headless = headless
         self.debug = debug
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.playwright = None
+        self._scrape_count = 0
+        self._context_lock = asyncio.Lock()
         
     async def __aenter__(self):
         """Context manager 진입"""
@@ -34,37 +198,51 @@ class SmartPlaceScraper:
         await self.close()
         
     async def initialize(self):
-        """브라우저 초기화"""
+        """브라우저 초기화 (실패 시 이미 시작된 드라이버/브라우저 정리)"""
+        try:
+            await self._launch()
+        except Exception:
+            await self.close()
+            raise
+        
+        if self.debug:
+            print("브라우저 초기화 완료")
+    
+    async def _launch(self):
+        """Playwright 드라이버, 브라우저, 공유 컨텍스트 시작"""
         self.playwright = await async_playwright().start()
         
-        # Lambda 환경을 위한 설정
-        browser_args = [
-            '--no-sandbox',
-            '--disable-setuid-sandbox',
-            '--disable-dev-shm-usage',
-            '--disable-accelerated-2d-canvas',
-            '--no-first-run',
-            '--no-zygote',
-            '--single-process',
-            '--disable-gpu',
-            '--disable-web-security',
-            '--disable-features=IsolateOrigins,site-per-process'
-        ]
+        # Lambda에서는 S3에서 받은 Chromium을 /tmp에서 실행
+        executable_path = await asyncio.to_thread(_ensure_chromium)
         
         self.browser = await self.playwright.chromium.launch(
             headless=self.headless,
-            args=browser_args
+            args=_browser_args(),
+            executable_path=executable_path
         )
         
-        if self.debug:
-            print("브라우저 초기화 완료")
+        # 스크래핑마다 컨텍스트를 새로 만들지 않고 재사용
+        self.context = await self._create_context()
     
-    async callable(self):
-        """브라우저 종료"""
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+    async def close(self):
+        """브라우저 종료 (여러 번 호출해도 안전, 일부 정리가 실패해도 나머지는 계속 진행)"""
+        context, self.context = self.context, None
+        browser, self.browser = self.browser, None
+        playwright, self.playwright = self.playwright, None
+        
+        # 브라우저/드라이버가 이미 죽은 경우 각 단계가 예외를 던질 수 있음
+        shutdowns = []
+        if context is not None:
+            shutdowns.append(context.close)
+        if browser is not None:
+            shutdowns.append(browser.close)
+        if playwright is not None:
+            shutdowns.append(playwright.stop)
+        for shutdown in shutdowns:
+            try:
+                await shutdown()
+            except Exception as e:
+                print(f"브라우저 종료 실패: {str(e)}")
             
     async def scrape(self, url: str) -> Dict[str, Any]:
         """
@@ -76,13 +254,7 @@ class SmartPlaceScraper:
         Returns:
             스크래핑된 데이터
         """
-        context = await self.browser.new_context(
-            viewport={'width': 1280, 'height': 720},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            locale='ko-KR'
-        )
-        
-        page = await context.new_page()
+        page = await self._new_page()
         
         try:
             # URL 처리
@@ -91,18 +263,28 @@ class SmartPlaceScraper:
             if self.debug:
                 print(f"최종 URL: {final_url}")
             
-            # 페이지 로드 대기
-            await page.wait_for_timeout(3000)
+            # 본문 렌더링 대기 (셀렉터가 없어도 가능한 데이터는 추출)
+            try:
+                await page.wait_for_selector(
+                    _CONTENT_READY_SELECTOR,
+                    state='attached',
+                    timeout=_CONTENT_READY_TIMEOUT
+                )
+            except PlaywrightTimeoutError:
+                if self.debug:
+                    print("본문 셀렉터 대기 시간 초과")
             
-            # 직접 평가로 데이터 추출
+            # 직접 평가로 데이터 추출 (셀렉터 기반 추출도 같은 호출에서 수행)
             extracted_data = await self._extract_with_evaluate(page)
+            dom_data = extracted_data.pop('dom', None)
             
-            # BeautifulSoup으로 추가 파싱
-            html_content = await page.content()
-            soup_data = self._extract_with_soup(html_content)
+            # 페이지 내 셀렉터 추출이 실패한 경우에만 HTML을 받아 BeautifulSoup으로 파싱
+            if dom_data is None:
+                html_content = await page.content()
+                dom_data = self._extract_with_soup(html_content)
             
             # 데이터 병합
-            merged_data = self._merge_data(extracted_data, soup_data)
+            merged_data = self._merge_data(extracted_data, dom_data)
             
             return {
                 'success': True,
@@ -121,7 +303,57 @@ class SmartPlaceScraper:
             }
             
         finally:
-            await context.close()
+            await page.close()
+    
+    async def scrape_many(self, urls: List[str], concurrency: int = 4) -> List[Dict[str, Any]]:
+        """
+        여러 스마트플레이스 페이지를 하나의 브라우저에서 동시에 스크래핑
+        
+        Args:
+            urls: 네이버 스마트플레이스 URL 목록
+            concurrency: 동시에 열어둘 최대 페이지 수
+            
+        Returns:
+            URL 순서대로 정렬된 스크래핑 결과 목록
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def scrape_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.scrape(url)
+        
+        results = await asyncio.gather(
+            *(scrape_one(url) for url in urls),
+            return_exceptions=True
+        )
+        
+        return [
+            result if not isinstance(result, BaseException) else {
+                'success': False,
+                'error': str(result),
+                'url': url,
+                'timestamp': datetime.now().isoformat()
+            }
+            for url, result in zip(urls, results)
+        ]
+    
+    async def _create_context(self) -> BrowserContext:
+        """리소스 차단이 적용된 브라우저 컨텍스트 생성"""
+        context = await self.browser.new_context(**_CONTEXT_OPTIONS)
+        await context.route('**/*', _block_heavy_resources)
+        return context
+    
+    async def _new_page(self) -> Page:
+        """공유 컨텍스트에서 새 페이지 생성 (일정 횟수마다 컨텍스트 재생성)"""
+        async with self._context_lock:
+            # 동시 스크래핑 중인 페이지가 있으면 모두 닫힌 뒤에 재생성
+            if self._scrape_count >= _CONTEXT_RECYCLE_INTERVAL and not self.context.pages:
+                await self.context.close()
+                self.context = await self._create_context()
+                self._scrape_count = 0
+            
+            self._scrape_count += 1
+            return await self.context.new_page()
     
     async def _navigate_to_store(self, page: Page, url: str) -> str:
         """스마트플레이스 페이지로 이동"""
@@ -134,17 +366,17 @@ class SmartPlaceScraper:
             
         # 모바일 URL을 PC 버전으로 변환
         if 'm.place.naver.com' in url or 'map.naver.com' in url:
-            place_id_match = re.search(r'(\d{8,})', url)
+            place_id_match = _PLACE_ID_RE.search(url)
             if place_id_match:
                 url = f'https://pcmap.place.naver.com/restaurant/{place_id_match.group(1)}/home'
         
-        await page.goto(url, wait_until='networkidle')
+        await page.goto(url, wait_until='domcontentloaded')
         return page.url
     
     async def _extract_with_evaluate(self, page: Page) -> Dict[str, Any]:
         """JavaScript 평가를 통한 데이터 추출"""
         
-        data = await page.evaluate('''() => {
+        data = await page.evaluate('''(domSelectors) => {
             const result = {
                 basicInfo: {},
                 menuItems: [],
@@ -226,27 +458,80 @@ class SmartPlaceScraper:
                     }
                 }
                 
-                // 5. 이미지 수집
-                document.querySelectorAll('img').forEach(img => {
-                    const src = img.src || img.dataset.src;
-                    if (src && src.includes('pstatic') && !src.includes('icon')) {
+                // 5. 이미지 수집 (중복 제외, 최대 개수에 도달하면 중단)
+                const imgs = document.getElementsByTagName('img');
+                const seenImages = new Set(result.images);
+                for (let i = 0; i < imgs.length && result.images.length < domSelectors.maxImages; i++) {
+                    const src = imgs[i].src || imgs[i].dataset.src;
+                    if (src && src.includes('pstatic') && !src.includes('icon') && !seenImages.has(src)) {
+                        seenImages.add(src);
                         result.images.push(src);
                     }
-                });
+                }
                 
             } catch (error) {
                 result.error = error.toString();
             }
             
+            // 6. 매장 정보/메뉴/리뷰 셀렉터 추출 (BeautifulSoup 파싱과 동일한 셀렉터)
+            try {
+                const dom = { basicInfo: {}, menuItems: [], reviews: [] };
+                const text = element => element ? element.textContent.trim() : '';
+                
+                for (const [key, selectorList] of Object.entries(domSelectors.fields)) {
+                    for (const selector of selectorList) {
+                        const element = document.querySelector(selector);
+                        if (element) {
+                            dom.basicInfo[key] = text(element);
+                            break;
+                        }
+                    }
+                }
+                
+                const menu = domSelectors.menu;
+                const menuItems = document.querySelectorAll(menu.item);
+                for (let i = 0; i < menuItems.length && i < domSelectors.maxMenuItems; i++) {
+                    const nameElem = menuItems[i].querySelector(menu.name);
+                    if (nameElem) {
+                        dom.menuItems.push({
+                            name: text(nameElem),
+                            price: text(menuItems[i].querySelector(menu.price))
+                        });
+                    }
+                }
+                
+                const review = domSelectors.review;
+                const reviews = document.querySelectorAll(review.item);
+                for (let i = 0; i < reviews.length && i < domSelectors.maxReviews; i++) {
+                    const textElem = reviews[i].querySelector(review.text);
+                    if (textElem) {
+                        const ratingElem = reviews[i].querySelector(review.rating);
+                        dom.reviews.push({
+                            rating: ratingElem ? ratingElem.textContent : '',
+                            text: text(textElem),
+                            date: text(reviews[i].querySelector(review.date))
+                        });
+                    }
+                }
+                
+                result.dom = dom;
+            } catch (error) {
+                result.domError = error.toString();
+            }
+            
             return result;
-        }''')
+        }''', _DOM_SELECTORS)
+        
+        # 별점은 Python 쪽 규칙으로 숫자 변환
+        for review in data.get('dom', {}).get('reviews', []):
+            review['rating'] = self._extract_rating(review['rating'])
         
         return data
     
     def _extract_with_soup(self, html: str) -> Dict[str, Any]:
-        """BeautifulSoup을 사용한 추가 데이터 추출"""
+        """BeautifulSoup을 사용한 데이터 추출 (페이지 내 추출 실패 시 폴백)"""
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         data = {
             'basicInfo': {},
             'menuItems': [],
@@ -254,25 +539,18 @@ class SmartPlaceScraper:
         }
         
         # 다양한 패턴으로 정보 추출
-        patterns = {
-            'name': ['span.GHAhO', 'span.Fc1rA', 'h2.place_title'],
-            'category': ['span.lnJFt', 'span.DJJvD'],
-            'address': ['span.IH7VW', 'span.LDgIH'],
-            'phone': ['span.xlx7Q']
-        }
-        
-        for key, selectors in patterns.items():
+        for key, selectors in _COMPILED_FIELD_SELECTORS.items():
             for selector in selectors:
-                element = soup.select_one(selector)
+                element = selector.select_one(soup)
                 if element:
                     data['basicInfo'][key] = element.get_text(strip=True)
                     break
         
         # 메뉴 아이템 추출
-        menu_items = soup.select('li.E2jtL')
-        for item in menu_items[:20]:
-            name_elem = item.select_one('span.lPzHi')
-            price_elem = item.select_one('div._3qFuX')
+        menu_items = soup.select(_MENU_SELECTORS['item'])
+        for item in menu_items[:_MAX_MENU_ITEMS]:
+            name_elem = item.select_one(_MENU_SELECTORS['name'])
+            price_elem = item.select_one(_MENU_SELECTORS['price'])
             
             if name_elem:
                 data['menuItems'].append({
@@ -281,11 +559,11 @@ class SmartPlaceScraper:
                 })
         
         # 리뷰 추출
-        reviews = soup.select('li.pui__X35jYm')
-        for review in reviews[:10]:
-            rating_elem = review.select_one('span.pui__bMWJiy')
-            text_elem = review.select_one('a.pui__xtsQN-')
-            date_elem = review.select_one('time span')
+        reviews = soup.select(_REVIEW_SELECTORS['item'])
+        for review in reviews[:_MAX_REVIEWS]:
+            rating_elem = review.select_one(_REVIEW_SELECTORS['rating'])
+            text_elem = review.select_one(_REVIEW_SELECTORS['text'])
+            date_elem = review.select_one(_REVIEW_SELECTORS['date'])
             
             if text_elem:
                 data['reviews'].append({
@@ -298,7 +576,7 @@ class SmartPlaceScraper:
     
     def _extract_rating(self, text: str) -> float:
         """별점 텍스트에서 숫자 추출"""
-        match = re.search(r'(\d+)', text)
+        match = _DIGIT_RE.search(text)
         return float(match.group(1)) if match else 0.0
     
     def _merge_data(self, eval_data: Dict, soup_data: Dict) -> Dict[str, Any]:
@@ -311,44 +589,102 @@ class SmartPlaceScraper:
             },
             'menuItems': eval_data.get('menuItems', []) + soup_data.get('menuItems', []),
             'reviews': eval_data.get('reviews', []) + soup_data.get('reviews', []),
-            'images': eval_data.get('images', [])[:10],
+            'images': eval_data.get('images', [])[:_MAX_IMAGES],
             'statistics': {
                 'rating': eval_data.get('basicInfo', {}).get('rating', 0),
                 'reviewCount': eval_data.get('basicInfo', {}).get('reviewCount', 0)
             }
         }
         
-        # 중복 제거
-        merged['menuItems'] = list({item['name']: item for item in merged['menuItems']}.values())[:20]
-        merged['reviews'] = merged['reviews'][:10]
+        # 중복 제거 (먼저 나온 항목 유지, 최대 개수에 도달하면 중단)
+        seen_names = set()
+        menu_items = []
+        for item in merged['menuItems']:
+            if item['name'] in seen_names:
+                continue
+            seen_names.add(item['name'])
+            menu_items.append(item)
+            if len(menu_items) == _MAX_MENU_ITEMS:
+                break
+        
+        merged['menuItems'] = menu_items
+        merged['reviews'] = merged['reviews'][:_MAX_REVIEWS]
         
         return merged
 
 
+# 웜 인보케이션 간 이벤트 루프와 브라우저를 재사용하기 위한 모듈 레벨 상태
+_LOOP = asyncio.new_event_loop()
+_SCRAPER: Optional[SmartPlaceScraper] = None
+
+
+async def _get_scraper() -> SmartPlaceScraper:
+    """초기화된 공유 스크래퍼 반환 (브라우저 연결이 끊겼으면 다시 생성)"""
+    global _SCRAPER
+    
+    if _SCRAPER is not None and not _SCRAPER.browser.is_connected():
+        # 정리 도중 예외가 나도 죽은 스크래퍼를 다시 쓰지 않도록 먼저 해제
+        stale_scraper, _SCRAPER = _SCRAPER, None
+        await stale_scraper.close()
+    
+    if _SCRAPER is None:
+        scraper = SmartPlaceScraper(headless=True)
+        await scraper.initialize()
+        _SCRAPER = scraper
+    
+    return _SCRAPER
+
+
+async def _scrape_with_shared_scraper(url: str) -> Dict[str, Any]:
+    """공유 스크래퍼로 스크래핑"""
+    scraper = await _get_scraper()
+    return await scraper.scrape(url)
+
+
+async def _scrape_many_with_shared_scraper(urls: List[str]) -> List[Dict[str, Any]]:
+    """공유 스크래퍼로 여러 URL 동시 스크래핑"""
+    scraper = await _get_scraper()
+    return await scraper.scrape_many(urls)
+
+
+def _bad_request(message: str) -> Dict[str, Any]:
+    """400 응답 생성"""
+    return {
+        'statusCode': 400,
+        'body': orjson.dumps({'error': message}).decode()
+    }
+
+
 # Lambda 핸들러
 def lambda_handler(event, context):
-    """AWS Lambda 핸들러"""
+    """AWS Lambda 핸들러 (단일 'url' 또는 여러 'urls' 지원)"""
     
     url = event.get('url')
-    if not url:
-        return {
-            'statusCode': 400,
-            'body': json.dumps({'error': 'URL is required'})
-        }
-    
-    # 동기 실행을 위한 래퍼
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    urls = event.get('urls')
+    if not url and urls is None:
+        return _bad_request('URL is required')
     
-    try:
-        result = loop.run_until_complete(scrape_store(url))
+    if urls is not None:
+        if not isinstance(urls, list) or not urls or \
+                not all(isinstance(item, str) and item for item in urls):
+            return _bad_request('urls must be a non-empty list of URL strings')
+        if len(urls) > _MAX_BATCH_URLS:
+            return _bad_request(f'urls supports at most {_MAX_BATCH_URLS} URLs per request')
+        
+        results = _LOOP.run_until_complete(_scrape_many_with_shared_scraper(urls))
         
         return {
-            'statusCode': 200 if result['success'] else 500,
-            'body': json.dumps(result, ensure_ascii=False)
+            'statusCode': 200 if any(result['success'] for result in results) else 500,
+            'body': orjson.dumps({'results': results}).decode()
         }
-    finally:
-        loop.close()
+    
+    # 루프와 브라우저는 닫지 않고 다음 인보케이션에서 재사용
+    result = _LOOP.run_until_complete(_scrape_with_shared_scraper(url))
+    
+    return {
+        'statusCode': 200 if result['success'] else 500,
+        'body': orjson.dumps(result).decode()
+    }
 
 
 async def scrape_store(url: str) -> Dict[str, Any]:
@@ -357,15 +693,23 @@ async def scrape_store(url: str) -> Dict[str, Any]:
         return await scraper.scrape(url)
 
 
+async def scrape_stores(urls: List[str]) -> List[Dict[str, Any]]:
+    """여러 URL을 브라우저 하나로 스크래핑하는 비동기 함수"""
+    async with SmartPlaceScraper(headless=True) as scraper:
+        return await scraper.scrape_many(urls)
+
+
 # CLI 실행
 if __name__ == '__main__':
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python smartplace_scraper.py <URL>")
+        print("Usage: python smartplace_scraper.py <URL> [URL ...]")
         sys.exit(1)
     
-    url = sys.argv[1]
-    result = asyncio.run(scrape_store(url))
+    if len(sys.argv) == 2:
+        result = asyncio.run(scrape_store(sys.argv[1]))
+    else:
+        result = asyncio.run(scrape_stores(sys.argv[1:]))
     
     print(json.dumps(result, ensure_ascii=False, indent=2))
\ No newline at end of file